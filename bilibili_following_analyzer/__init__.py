@@ -4,15 +4,35 @@ Bilibili Following Analyzer.
 A tool to analyze your Bilibili following list using composable filters.
 """
 
-from importlib.metadata import version
+from __future__ import annotations
 
-from .cache import CachedDataFetcher, get_cache, get_cache_dir
-from .cli import main
-from .client import BilibiliAPIError, BilibiliClient
-from .filters import Filter, FilterContext, FilterResult, Following, MatchInfo
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
 
-__version__ = version('bilibili-following-analyzer')
+if TYPE_CHECKING:
+    from .cache import CachedDataFetcher, get_cache, get_cache_dir
+    from .cli import main
+    from .client import BilibiliAPIError, BilibiliClient
+    from .filters import Filter, FilterContext, FilterResult, Following, MatchInfo
+
+
+# Public name -> defining submodule. Submodules are imported on first access
+# so that importing the package (e.g. to run the CLI) stays cheap.
+_EXPORTS = {
+    'BilibiliAPIError': 'client',
+    'BilibiliClient': 'client',
+    'CachedDataFetcher': 'cache',
+    'Filter': 'filters',
+    'FilterContext': 'filters',
+    'FilterResult': 'filters',
+    'Following': 'filters',
+    'MatchInfo': 'filters',
+    'get_cache': 'cache',
+    'get_cache_dir': 'cache',
+    'main': 'cli',
+}
+
 __all__ = [
     'BilibiliAPIError',
     'BilibiliClient',
@@ -27,3 +47,17 @@ __all__ = [
     'main',
     '__version__',
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve public names lazily (PEP 562)."""
+    if name == '__version__':
+        from importlib.metadata import version
+
+        value = version('bilibili-following-analyzer')
+    elif name in _EXPORTS:
+        value = getattr(import_module(f'.{_EXPORTS[name]}', __name__), name)
+    else:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    globals()[name] = value
+    return value
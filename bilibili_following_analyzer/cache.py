@@ -5,7 +5,6 @@ from __future__ import annotations
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-import diskcache
 import platformdirs
 
 
@@ -16,6 +15,10 @@ if TYPE_CHECKING:
 # Default TTLs in seconds
 TTL_USER_STAT = 24 * 60 * 60  # 24 hours - follower / following counts change slowly
 TTL_USER_ACTIVITY = 6 * 60 * 60  # 6 hours - post activity changes more often
+TTL_INTERACTIONS = 6 * 60 * 60  # 6 hours - new comments trickle in slowly
+TTL_WBI_KEYS = 6 * 60 * 60  # 6 hours - keys rotate roughly daily
+TTL_NO_COMMENTS = 30 * 24 * 60 * 60  # 30 days - comment sections rarely reappear
+TTL_BUVID3 = 7 * 24 * 60 * 60  # 7 days - the device cookie is long-lived
 
 # Cache size limit (10 MB - sufficient for ~1000 users with stat + activity data)
 CACHE_SIZE_LIMIT = 10 * 1024 * 1024
@@ -55,6 +58,10 @@ def get_cache(directory: Path | None = None) -> Cache:
     Cache
         A diskcache Cache instance.
     """
+    # Imported here so that showing the default cache directory in --help
+    # does not load diskcache
+    import diskcache
+
     cache_dir = directory or get_cache_dir()
     cache_dir.mkdir(parents=True, exist_ok=True)
     return diskcache.Cache(str(cache_dir), size_limit=CACHE_SIZE_LIMIT)
@@ -67,6 +74,12 @@ def make_user_stat_key(mid: int) -> str:
 
 USER_ACTIVITY_KEY_PREFIX = 'user_activity_v2:'
 
+# Cache key for the (img_key, sub_key) pair used for WBI signing
+WBI_KEYS_KEY = 'wbi_keys'
+
+# Cache key for the buvid3 device cookie sent along with WBI-signed requests
+BUVID3_KEY = 'buvid3'
+
 
 def make_user_activity_key(mid: int) -> str:
     """Generate cache key for user activity data.
@@ -77,6 +90,20 @@ def make_user_activity_key(mid: int) -> str:
     return f'{USER_ACTIVITY_KEY_PREFIX}{mid}'
 
 
+def make_interactions_key(mid: int, num_videos: int, num_dynamics: int) -> str:
+    """Generate cache key for the users interacting with a user's posts.
+
+    The post counts are part of the key, so changing ``--num-videos`` or
+    ``--num-dynamics`` does not reuse a set collected over a different window.
+    """
+    return f'interactions:{mid}:{num_videos}:{num_dynamics}'
+
+
+def make_no_comments_key(dynamic_id: str) -> str:
+    """Generate cache key marking a dynamic that has no comment section."""
+    return f'no_comments:{dynamic_id}'
+
+
 class CachedDataFetcher:
     """
     Wrapper that adds caching to data fetching operations.
@@ -98,6 +125,52 @@ class CachedDataFetcher:
         """
         self.cache = cache
 
+    def get(self, key: str) -> Any:
+        """
+        Get a cached value without fetching.
+
+        Parameters
+        ----------
+        key : str
+            The cache key.
+
+        Returns
+        -------
+        Any
+            The cached value, or None on a miss or if caching is disabled.
+        """
+        if self.cache is None:
+            return None
+        return self.cache.get(key)
+
+    def set(self, key: str, value: Any, ttl: int) -> None:
+        """
+        Store a value without fetching.
+
+        Parameters
+        ----------
+        key : str
+            The cache key.
+        value : Any
+            The value to cache.
+        ttl : int
+            Time-to-live in seconds.
+        """
+        if self.cache is not None:
+            self.cache.set(key, value, expire=ttl)
+
+    def delete(self, key: str) -> None:
+        """
+        Remove a cached value, if present.
+
+        Parameters
+        ----------
+        key : str
+            The cache key.
+        """
+        if self.cache is not None:
+            self.cache.delete(key)
+
     def get_or_fetch(
         self,
         key: str,
@@ -3,33 +3,25 @@
 from __future__ import annotations
 
 import argparse
+import logging
 import os
 import sys
+import threading
 from collections import Counter
 from collections.abc import Callable, Sequence
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, TypeVar
-
-from dotenv import load_dotenv
-from tqdm import tqdm
-
-from .cache import (
-    USER_ACTIVITY_KEY_PREFIX,
-    CachedDataFetcher,
-    get_cache,
-    get_cache_dir,
-)
-from .client import ActivityStatus, BilibiliClient, UserActivity
-from .filters import (
-    Filter,
-    FilterContext,
-    FilterResult,
-    Following,
-    get_filter_help,
-    parse_filter_expression,
-    parse_filter_spec,
-)
-from .utils import load_allow_list, output_results_to_file, print_filter_results
+from typing import TYPE_CHECKING, Any
+
+
+# Heavy dependencies (requests, diskcache, tqdm, ...) are imported inside the
+# functions that use them, so `--help` and argument errors exit quickly
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    from .cache import CachedDataFetcher
+    from .client import BilibiliClient
+    from .filters import Filter, FilterContext, FilterResult, Following
 
 
 def _report_activity_failures(ctx: FilterContext) -> None:
@@ -38,6 +30,8 @@ def _report_activity_failures(ctx: FilterContext) -> None:
     Surfaces fetch failures (rate limits, risk-control challenges, etc.) so
     they aren't silently treated as "no posts" by activity-based filters.
     """
+    from .client import ActivityStatus
+
     failed = [
         a for a in ctx.user_activity.values() if a.status == ActivityStatus.UNAVAILABLE
     ]
@@ -59,6 +53,9 @@ def _purge_unavailable_activity(cache_fetcher: CachedDataFetcher) -> int:
     only re-fetches the previously failed users. Returns the number of
     entries purged.
     """
+    from .cache import USER_ACTIVITY_KEY_PREFIX
+    from .client import ActivityStatus, UserActivity
+
     cache = cache_fetcher.cache
     if cache is None:
         return 0
@@ -77,52 +74,47 @@ def _purge_unavailable_activity(cache_fetcher: CachedDataFetcher) -> int:
     return purged
 
 
-T = TypeVar('T')
+# Numeric options that can be set from the environment:
+# name -> (parser, human-readable type name, default)
+_ENV_NUMBERS: dict[str, tuple[Callable[[str], float], str, float]] = {
+    'DELAY': (float, 'number', 0.3),
+    'WORKERS': (int, 'integer', 5),
+    'NUM_VIDEOS': (int, 'integer', 10),
+    'NUM_DYNAMICS': (int, 'integer', 20),
+}
 
 
-def _env_parse(name: str, default: T, parser: Callable[[str], T], type_name: str) -> T:
+def _env_numbers() -> dict[str, float]:
     """
-    Parse an environment variable with a type converter.
-
-    Parameters
-    ----------
-    name : str
-        The environment variable name.
-    default : T
-        The default value if the variable is not set or empty.
-    parser : Callable[[str], T]
-        Function to convert string to the desired type.
-    type_name : str
-        Human-readable type name for error messages.
+    Parse all numeric environment variables in one pass.
 
     Returns
     -------
-    T
-        The parsed value.
+    dict[str, float]
+        The parsed value, or the default if unset or empty, for every
+        variable in ``_ENV_NUMBERS``.
 
     Raises
     ------
     SystemExit
-        If the value is set but cannot be parsed.
+        If any variable is set but cannot be parsed. All invalid variables
+        are reported together.
     """
-    val = os.environ.get(name)
-    if not val:
-        return default
-    try:
-        return parser(val)
-    except ValueError:
-        msg = f'Error: {name} must be a valid {type_name}, got {val!r}'
-        raise SystemExit(msg) from None
-
-
-def _env_int(name: str, default: int) -> int:
-    """Get an integer from an environment variable with a default."""
-    return _env_parse(name, default, int, 'integer')
-
+    values: dict[str, float] = {}
+    errors: list[str] = []
+    for name, (parser, type_name, default) in _ENV_NUMBERS.items():
+        val = os.environ.get(name)
+        if not val:
+            values[name] = default
+            continue
+        try:
+            values[name] = parser(val)
+        except ValueError:
+            errors.append(f'Error: {name} must be a valid {type_name}, got {val!r}')
 
-def _env_float(name: str, default: float) -> float:
-    """Get a float from an environment variable with a default."""
-    return _env_parse(name, default, float, 'number')
+    if errors:
+        raise SystemExit('\n'.join(errors))
+    return values
 
 
 def _env_list(name: str) -> list[str]:
@@ -156,6 +148,8 @@ class FilterHelpAction(argparse.Action):
         option_string: str | None = None,
     ) -> None:
         del parser, namespace, values, option_string  # Unused
+        from .filters import get_filter_help
+
         print(get_filter_help())
         sys.exit(0)
 
@@ -169,6 +163,10 @@ def parse_args() -> argparse.Namespace:
     argparse.Namespace
         Parsed arguments.
     """
+    from .cache import get_cache_dir
+
+    env_numbers = _env_numbers()
+
     parser = argparse.ArgumentParser(
         description='Analyze your Bilibili following list with composable filters',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -196,15 +194,30 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         '--delay',
         type=float,
-        default=_env_float('DELAY', 0.3),
+        default=env_numbers['DELAY'],
         help='Delay between API requests in seconds (default: 0.3). Env: DELAY',
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=env_numbers['WORKERS'],
+        help=(
+            'Number of concurrent API fetches (default: 5). '
+            'Requests stay paced by --delay. Env: WORKERS'
+        ),
+    )
     parser.add_argument(
         '--limit',
         type=int,
         default=None,
         help='Limit analysis to the first N followings (for testing)',
     )
+    parser.add_argument(
+        '-v',
+        '--verbose',
+        action='store_true',
+        help='Log every API request and rate limit adjustment to stderr',
+    )
     output_default = os.environ.get('OUTPUT')
     parser.add_argument(
         '-o',
@@ -260,13 +273,13 @@ def parse_args() -> argparse.Namespace:
     interaction_group.add_argument(
         '--num-videos',
         type=int,
-        default=_env_int('NUM_VIDEOS', 10),
+        default=env_numbers['NUM_VIDEOS'],
         help='Number of recent videos to check for interactions. Env: NUM_VIDEOS',
     )
     interaction_group.add_argument(
         '--num-dynamics',
         type=int,
-        default=_env_int('NUM_DYNAMICS', 20),
+        default=env_numbers['NUM_DYNAMICS'],
         help='Number of recent dynamics to check for interactions. Env: NUM_DYNAMICS',
     )
 
@@ -303,11 +316,39 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+# Field accessors bound once for the per-item collection loops
+_get_member = itemgetter('member')
+_get_mid = itemgetter('mid')
+_get_following_fields = itemgetter('mid', 'uname', 'attribute')
+
+
+def _check_stopped(stop: threading.Event | None) -> None:
+    """Abort an interaction collection whose result is no longer wanted."""
+    from concurrent.futures import CancelledError
+
+    if stop is not None and stop.is_set():
+        raise CancelledError('Interaction collection was stopped')
+
+
+def _video_commenters(
+    client: BilibiliClient, stop: threading.Event | None, aid: int
+) -> set[int]:
+    """Collect the user IDs who commented on a single video."""
+    _check_stopped(stop)
+    return {
+        int(_get_mid(_get_member(comment)))
+        for comment in client.get_video_comments(aid, max_count=100)
+    }
+
+
 def _collect_video_interactions(
     client: BilibiliClient,
     mid: int,
     num_videos: int,
     users: set[int],
+    max_workers: int = 5,
+    stop: threading.Event | None = None,
+    quiet: bool = False,
 ) -> None:
     """
     Collect user IDs from video comments.
@@ -322,12 +363,67 @@ def _collect_video_interactions(
         Number of recent videos to check.
     users : set[int]
         Set to add interacting user IDs to (modified in place).
+    max_workers : int
+        Number of videos whose comments are fetched concurrently.
+    stop : threading.Event or None
+        Once set, the remaining videos are skipped and CancelledError is raised.
+    quiet : bool
+        Hide the progress bar.
     """
+    from concurrent.futures import ThreadPoolExecutor
+    from functools import partial
+
+    from .utils import progress
+
+    _check_stopped(stop)
     videos = list(client.get_user_videos(mid, max_count=num_videos))
-    for video in tqdm(videos, desc='Videos', unit='video'):
-        aid = video['aid']
-        for comment in client.get_video_comments(aid, max_count=100):
-            users.add(int(comment['member']['mid']))
+    aids = [video['aid'] for video in videos]
+    # Requests stay paced by the client's shared rate limiter; the pool only
+    # overlaps their round trips
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        for commenters in progress(
+            executor.map(partial(_video_commenters, client, stop), aids),
+            total=len(aids),
+            desc='Videos',
+            unit='video',
+            quiet=quiet,
+        ):
+            users.update(commenters)
+
+
+def _dynamic_interactors(
+    client: BilibiliClient,
+    cache_fetcher: CachedDataFetcher,
+    stop: threading.Event | None,
+    dynamic_id: str,
+) -> set[int]:
+    """Collect the user IDs who reacted to or commented on a single dynamic."""
+    from .cache import TTL_NO_COMMENTS, make_no_comments_key
+    from .client import BilibiliAPIError
+
+    _check_stopped(stop)
+
+    # Get likes and forwards
+    users = {
+        int(_get_mid(reaction)) for reaction in client.get_dynamic_reactions(dynamic_id)
+    }
+
+    # Get comments (some dynamic types don't support comments)
+    no_comments_key = make_no_comments_key(dynamic_id)
+    if cache_fetcher.get(no_comments_key):
+        return users
+    try:
+        users.update(
+            int(_get_mid(_get_member(comment)))
+            for comment in client.get_dynamic_comments(dynamic_id, max_count=100)
+        )
+    except BilibiliAPIError as e:
+        if e.code == -404:
+            # Dynamic has no comment section; remember it for later runs
+            cache_fetcher.set(no_comments_key, True, TTL_NO_COMMENTS)
+        else:
+            raise
+    return users
 
 
 def _collect_dynamic_interactions(
@@ -335,6 +431,10 @@ def _collect_dynamic_interactions(
     mid: int,
     num_dynamics: int,
     users: set[int],
+    max_workers: int = 5,
+    cache_fetcher: CachedDataFetcher | None = None,
+    stop: threading.Event | None = None,
+    quiet: bool = False,
 ) -> None:
     """
     Collect user IDs from dynamic reactions and comments.
@@ -349,26 +449,40 @@ def _collect_dynamic_interactions(
         Number of recent dynamics to check.
     users : set[int]
         Set to add interacting user IDs to (modified in place).
+    max_workers : int
+        Number of dynamics whose interactions are fetched concurrently.
+    cache_fetcher : CachedDataFetcher or None
+        Disk cache remembering dynamics without a comment section.
+    stop : threading.Event or None
+        Once set, the remaining dynamics are skipped and CancelledError is
+        raised.
+    quiet : bool
+        Hide the progress bar.
     """
-    from .client import BilibiliAPIError
+    from concurrent.futures import ThreadPoolExecutor
+    from functools import partial
 
-    dynamics = list(client.get_user_dynamics(mid, max_count=num_dynamics))
-    for dynamic in tqdm(dynamics, desc='Dynamics', unit='dyn'):
-        dynamic_id = dynamic['id_str']
+    from .cache import CachedDataFetcher
+    from .utils import progress
 
-        # Get likes and forwards
-        for reaction in client.get_dynamic_reactions(dynamic_id):
-            users.add(int(reaction['mid']))
+    if cache_fetcher is None:
+        cache_fetcher = CachedDataFetcher(cache=None)
 
-        # Get comments (some dynamic types don't support comments)
-        try:
-            for comment in client.get_dynamic_comments(dynamic_id, max_count=100):
-                users.add(int(comment['member']['mid']))
-        except BilibiliAPIError as e:
-            if e.code == -404:
-                pass  # Dynamic has no comment section
-            else:
-                raise
+    _check_stopped(stop)
+    dynamics = list(client.get_user_dynamics(mid, max_count=num_dynamics))
+    dynamic_ids = [dynamic['id_str'] for dynamic in dynamics]
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        for interactors in progress(
+            executor.map(
+                partial(_dynamic_interactors, client, cache_fetcher, stop),
+                dynamic_ids,
+            ),
+            total=len(dynamic_ids),
+            desc='Dynamics',
+            unit='dyn',
+            quiet=quiet,
+        ):
+            users.update(interactors)
 
 
 def collect_interacting_users(
@@ -376,6 +490,10 @@ def collect_interacting_users(
     my_mid: int,
     num_videos: int,
     num_dynamics: int,
+    max_workers: int = 5,
+    cache_fetcher: CachedDataFetcher | None = None,
+    stop: threading.Event | None = None,
+    quiet: bool = False,
 ) -> set[int]:
     """
     Collect all user IDs who interacted with recent posts.
@@ -390,19 +508,43 @@ def collect_interacting_users(
         Number of recent videos to check.
     num_dynamics : int
         Number of recent dynamics to check.
+    max_workers : int
+        Number of posts whose interactions are fetched concurrently.
+    cache_fetcher : CachedDataFetcher or None
+        Disk cache remembering dynamics without a comment section.
+    stop : threading.Event or None
+        Set from another thread to abandon the collection between posts.
+    quiet : bool
+        Hide the progress bars.
 
     Returns
     -------
     set[int]
         Set of user IDs who have interacted.
+
+    Raises
+    ------
+    concurrent.futures.CancelledError
+        If ``stop`` was set before the collection finished.
     """
     interacting_users: set[int] = set()
 
     if num_videos > 0:
-        _collect_video_interactions(client, my_mid, num_videos, interacting_users)
+        _collect_video_interactions(
+            client, my_mid, num_videos, interacting_users, max_workers, stop, quiet
+        )
 
     if num_dynamics > 0:
-        _collect_dynamic_interactions(client, my_mid, num_dynamics, interacting_users)
+        _collect_dynamic_interactions(
+            client,
+            my_mid,
+            num_dynamics,
+            interacting_users,
+            max_workers,
+            cache_fetcher,
+            stop,
+            quiet,
+        )
 
     return interacting_users
 
@@ -432,27 +574,40 @@ def apply_filters(
     list[FilterResult]
         Results for users who matched the filter criteria.
     """
+    from .filters import FilterResult
+    from .utils import progress
+
     results: list[FilterResult] = []
 
     print(f'Applying {len(filters)} filter(s) in {mode.upper()} mode...')
 
-    for following in tqdm(followings, desc='Filtering', unit='user'):
-        result = FilterResult(following=following)
+    # Cheapest filters run first, so in AND mode a user they reject never
+    # reaches the filters that need stats or activity.
+    ordered = sorted(enumerate(filters), key=lambda item: item[1].cost)
+
+    for following in progress(followings, desc='Filtering', unit='user'):
+        hits: list[tuple[int, str | None]] = []
 
-        for f in filters:
+        for index, f in ordered:
             match_info = f.matches(following, ctx)
             if match_info.matched:
-                result.add_match(f.name, match_info.detail)
+                hits.append((index, match_info.detail))
+            elif mode == 'and':
+                break
 
         # Determine if this user should be included in results
         if mode == 'and':
             # All filters must match
-            if len(result.matched_filters) == len(filters):
-                results.append(result)
-        else:  # mode == 'or'
+            if len(hits) != len(filters):
+                continue
+        elif not hits:  # mode == 'or'
             # Any filter matches
-            if result.matched_filters:
-                results.append(result)
+            continue
+
+        result = FilterResult(following=following)
+        for index, detail in sorted(hits, key=lambda hit: hit[0]):
+            result.add_match(filters[index].name, detail)
+        results.append(result)
 
     print(f'  Found {len(results)} matching users')
 
@@ -481,11 +636,14 @@ def apply_filter_expression(
     list[FilterResult]
         Results for users who matched the filter expression.
     """
+    from .filters import FilterResult
+    from .utils import progress
+
     results: list[FilterResult] = []
 
     print('Applying filter expression...')
 
-    for following in tqdm(followings, desc='Filtering', unit='user'):
+    for following in progress(followings, desc='Filtering', unit='user'):
         match_info = composite_filter.matches(following, ctx)
         if match_info.matched:
             result = FilterResult(following=following)
@@ -520,6 +678,8 @@ def _collect_filter_specs(args: argparse.Namespace) -> list[str]:
 
 def _parse_filters(filter_specs: list[str]) -> list[Filter]:
     """Parse filter specifications into Filter instances."""
+    from .filters import parse_filter_spec
+
     filters: list[Filter] = []
     for spec in filter_specs:
         try:
@@ -531,6 +691,8 @@ def _parse_filters(filter_specs: list[str]) -> list[Filter]:
 
 def _setup_cache(args: argparse.Namespace) -> CachedDataFetcher:
     """Initialize disk cache based on arguments."""
+    from .cache import CachedDataFetcher, get_cache, get_cache_dir
+
     if args.no_cache:
         print('Disk cache: disabled')
         return CachedDataFetcher(cache=None)
@@ -557,30 +719,106 @@ def _fetch_followings(
     limit: int | None = None,
 ) -> list[Following]:
     """Fetch followings and filter by allow list."""
+    from .filters import Following
+
     print('Fetching followings...')
     followings: list[Following] = []
     for f in client.get_followings(mid):
-        user_mid = int(f['mid'])
+        raw_mid, name, attribute = _get_following_fields(f)
+        user_mid = raw_mid if type(raw_mid) is int else int(raw_mid)
         if user_mid in allow_list:
             continue
-        followings.append(
-            Following(mid=user_mid, name=f['uname'], attribute=f['attribute'])
-        )
+        followings.append(Following(mid=user_mid, name=name, attribute=attribute))
         if limit and len(followings) >= limit:
             break
     print(f'  Found {len(followings)} followings (after allow list)')
     return followings
 
 
-def _needs_interaction_data(filter_obj: Filter) -> bool:
-    """Check if a filter (possibly composite) needs interaction data."""
-    from .filters import AndFilter, OrFilter
+def _prefetch_user_data(
+    followings: list[Following],
+    conjuncts: list[Filter],
+    ctx: FilterContext,
+    max_workers: int,
+) -> None:
+    """
+    Concurrently fetch the per-user data the filters will need.
 
-    if filter_obj.name == 'no-interaction':
-        return True
-    if isinstance(filter_obj, (AndFilter, OrFilter)):
-        return any(_needs_interaction_data(f) for f in filter_obj.filters)
-    return False
+    Parameters
+    ----------
+    followings : list[Following]
+        The users that will be filtered.
+    conjuncts : list[Filter]
+        Filters that must all match for a user to be reported. Data is fetched
+        one kind at a time, cheapest first. Before each kind, the conjuncts
+        answerable with what is already known are applied, so users they
+        reject are not fetched for it.
+    ctx : FilterContext
+        Shared context whose caches are warmed.
+    max_workers : int
+        Number of concurrent fetches.
+    """
+    from .filters import FETCHED_DATA
+
+    required = frozenset().union(*(f.requires for f in conjuncts))
+    if not required:
+        return
+
+    prefetchers = {
+        'stat': ctx.prefetch_user_stats,
+        'activity': ctx.prefetch_user_activity,
+    }
+    pending = list(conjuncts)
+    candidates = followings
+    # Interacting users are collected before filtering starts
+    fetched = {'interactions'}
+    for kind in FETCHED_DATA:
+        if kind not in required:
+            continue
+        ready = [f for f in pending if f.requires <= fetched]
+        pending = [f for f in pending if f not in ready]
+        candidates = [
+            following
+            for following in candidates
+            if all(f.matches(following, ctx).matched for f in ready)
+        ]
+        prefetchers[kind](
+            [following.mid for following in candidates], max_workers=max_workers
+        )
+        fetched.add(kind)
+
+
+def _collect_interacting_users_cached(
+    client: BilibiliClient,
+    cache_fetcher: CachedDataFetcher,
+    args: argparse.Namespace,
+    stop: threading.Event,
+) -> set[int]:
+    """
+    Collect interacting users, reusing a recent run's result if cached.
+
+    Runs in the background next to the followings fetch, so it draws no
+    progress bars, and gives up between posts once ``stop`` is set. A
+    stopped collection raises instead of caching a partial result.
+    """
+    from .cache import TTL_INTERACTIONS, make_interactions_key
+
+    key = make_interactions_key(args.mid, args.num_videos, args.num_dynamics)
+    users: set[int] = cache_fetcher.get_or_fetch(
+        key,
+        lambda: collect_interacting_users(
+            client,
+            args.mid,
+            args.num_videos,
+            args.num_dynamics,
+            args.workers,
+            cache_fetcher,
+            stop,
+            quiet=True,
+        ),
+        TTL_INTERACTIONS,
+    )
+    return users
 
 
 def _run_analysis(
@@ -595,25 +833,57 @@ def _run_analysis(
 
     Either filters (simple mode) or composite_filter (expression mode) should be set.
     """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from .client import BilibiliClient
+    from .filters import AndFilter, FilterContext, OrFilter
+
     # Check if we need interaction data
     if composite_filter:
-        needs_interactions = _needs_interaction_data(composite_filter)
+        needs_interactions = 'interactions' in composite_filter.requires
     else:
-        needs_interactions = any(f.name == 'no-interaction' for f in (filters or []))
-
-    with BilibiliClient(sessdata=args.sessdata, delay=args.delay) as client:
-        # Collect interacting users if needed
-        interacting_users: set[int] = set()
+        needs_interactions = any('interactions' in f.requires for f in filters or [])
+
+    with (
+        BilibiliClient(
+            sessdata=args.sessdata,
+            delay=args.delay,
+            # Concurrent workers plus the main thread fetching followings
+            max_connections=args.workers + 1,
+            cache=cache_fetcher,
+        ) as client,
+        ThreadPoolExecutor(max_workers=1) as background,
+    ):
+        # Collect interacting users in the background while followings are
+        # fetched; both share the client's rate limiter
+        pending_interactions: Future[set[int]] | None = None
+        stop = threading.Event()
         if needs_interactions:
             total_posts = args.num_videos + args.num_dynamics
             if total_posts > 0:
-                interacting_users = collect_interacting_users(
+                pending_interactions = background.submit(
+                    _collect_interacting_users_cached,
                     client,
-                    args.mid,
-                    args.num_videos,
-                    args.num_dynamics,
+                    cache_fetcher,
+                    args,
+                    stop,
                 )
+
+        try:
+            # Fetch followings
+            followings = _fetch_followings(client, args.mid, allow_list, args.limit)
+
+            interacting_users: set[int] = set()
+            if pending_interactions is not None:
+                if not pending_interactions.done():
+                    print('\nWaiting for interactions on your recent posts...')
+                interacting_users = pending_interactions.result()
                 print(f'\nFound {len(interacting_users)} unique users who interacted')
+        except BaseException:
+            # Errors and Ctrl-C should not wait for the background collection
+            # to go through every remaining post before the executor exits
+            stop.set()
+            raise
 
         # Build filter context
         ctx = FilterContext(
@@ -623,8 +893,19 @@ def _run_analysis(
             cache=cache_fetcher,
         )
 
-        # Fetch followings and apply filters
-        followings = _fetch_followings(client, args.mid, allow_list, args.limit)
+        # Prefetch per-user data and apply filters
+
+        if composite_filter:
+            conjuncts = (
+                composite_filter.filters
+                if isinstance(composite_filter, AndFilter)
+                else [composite_filter]
+            )
+        elif args.filter_mode == 'and':
+            conjuncts = filters or []
+        else:
+            conjuncts = [OrFilter(filters or [])]
+        _prefetch_user_data(followings, conjuncts, ctx, args.workers)
 
         if composite_filter:
             results = apply_filter_expression(followings, composite_filter, ctx)
@@ -641,12 +922,24 @@ def main() -> None:
 
     Loads environment variables, parses arguments, and runs the analysis.
     """
+    from dotenv import load_dotenv
+
     load_dotenv()
     args = parse_args()
+    logging.basicConfig(
+        level=logging.WARNING, format='%(levelname)s %(name)s: %(message)s'
+    )
+    # Only this package's loggers get verbose; urllib3 and friends stay quiet
+    logging.getLogger(__package__).setLevel(
+        logging.DEBUG if args.verbose else logging.WARNING
+    )
 
     if not args.mid:
         raise SystemExit('Error: --mid is required (or set MID in .env)')
 
+    from .filters import parse_filter_expression
+    from .utils import load_allow_list, output_results_to_file, print_filter_results
+
     # Parse filters (expression mode or simple mode)
     filters: list[Filter] | None = None
     composite_filter: Filter | None = None
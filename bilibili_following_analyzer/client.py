@@ -2,22 +2,43 @@
 
 from __future__ import annotations
 
+import logging
+import threading
 import time
 import urllib.parse
 from dataclasses import dataclass
 from enum import Enum
-from functools import reduce
 from hashlib import md5
 from http.cookiejar import Cookie, CookieJar
+from itertools import islice
 from typing import TYPE_CHECKING, Any
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+from .cache import (
+    BUVID3_KEY,
+    TTL_BUVID3,
+    TTL_WBI_KEYS,
+    WBI_KEYS_KEY,
+    CachedDataFetcher,
+)
+
+
+try:  # Optional faster JSON decoder (pip install bilibili-following-analyzer[fast])
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads  # type: ignore[assignment]
 
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
 
 
+logger = logging.getLogger(__name__)
+
+
 class ActivityStatus(Enum):
     """
     Outcome of an attempt to fetch a user's activity data.
@@ -77,14 +98,89 @@ class UserActivity:
 
 # fmt: off
 # WBI signature encoding table
-MIXIN_KEY_ENC_TAB = [
+MIXIN_KEY_ENC_TAB = (
     46, 47, 18,  2, 53,  8, 23, 32, 15, 50, 10, 31, 58,  3, 45, 35,
     27, 43,  5, 49, 33,  9, 42, 19, 29, 28, 14, 39, 12, 38, 41, 13,
     37, 48,  7, 16, 24, 55, 40, 61, 26, 17,  0,  1, 60, 51, 30,  4,
     22, 25, 54, 21, 56, 59,  6, 63, 57, 62, 11, 36, 20, 34, 44, 52,
-]
+)
 # fmt: on
 
+# Characters WBI signing removes from parameter values, as a str.translate table
+WBI_STRIP_TABLE = str.maketrans('', '', "!'()*")
+
+
+# API codes returned when requests are being throttled (-412: request blocked,
+# -799: requests too frequent)
+THROTTLE_CODES = frozenset({-412, -799})
+
+# API code returned when risk control rejects a request, typically because the
+# WBI keys or the buvid3 cookie went stale
+RISK_CONTROL_CODE = -352
+
+
+class _TokenBucket:
+    """
+    Thread-safe token bucket used to pace API requests.
+
+    Tokens refill at ``rate`` per second up to ``capacity``, so short bursts
+    go out back-to-back while the long-run rate stays bounded. A caller that
+    finds the bucket empty takes a token on credit and sleeps outside the
+    lock until it is due, so concurrent callers queue up in order.
+
+    Parameters
+    ----------
+    rate : float
+        Tokens added per second.
+    capacity : float
+        Maximum number of tokens the bucket holds.
+    """
+
+    # Lowest rate reachable through backoff, as a fraction of the base rate
+    MIN_RATE_FACTOR = 1 / 16
+
+    # Consecutive unthrottled responses needed before doubling the rate
+    RECOVERY_STREAK = 20
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.base_rate = rate
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._streak = 0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until it is available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+    def backoff(self) -> None:
+        """Halve the rate after a throttled response."""
+        with self._lock:
+            self.rate = max(self.rate / 2, self.base_rate * self.MIN_RATE_FACTOR)
+            self._tokens = min(self._tokens, 0.0)
+            self._streak = 0
+
+    def recover(self) -> None:
+        """Record an unthrottled response, restoring the rate over time."""
+        with self._lock:
+            if self.rate >= self.base_rate:
+                return
+            self._streak += 1
+            if self._streak >= self.RECOVERY_STREAK:
+                self.rate = min(self.rate * 2, self.base_rate)
+                self._streak = 0
+
 
 class BilibiliAPIError(Exception):
     """
@@ -116,6 +212,21 @@ class BilibiliClient:
         SESSDATA cookie for authentication. Required for some APIs.
     delay : float, optional
         Delay between API requests in seconds. Default is 0.3.
+    max_connections : int, optional
+        Keep-alive connections pooled per host. Should cover the number of
+        threads sharing the client. Default is 10.
+    cache : CachedDataFetcher or None, optional
+        Disk cache used to reuse WBI keys and the buvid3 cookie across runs.
+        Default is None.
+    burst : int, optional
+        Requests that may go out back-to-back before pacing by ``delay``
+        kicks in. Default is ``RATE_BURST``.
+
+    Notes
+    -----
+    The client is safe to share between threads. Requests from all threads
+    are paced by a single rate limiter, so running them concurrently only
+    overlaps network round trips without exceeding the configured rate.
 
     Attributes
     ----------
@@ -138,10 +249,50 @@ class BilibiliClient:
         'Referer': 'https://www.bilibili.com/',
     }
 
-    def __init__(self, sessdata: str | None = None, delay: float = 0.3) -> None:
+    # Seconds to wait for a connection or response before giving up
+    REQUEST_TIMEOUT = 10.0
+
+    # Requests that may go out back-to-back before pacing kicks in
+    RATE_BURST = 3
+
+    # Retries for connection errors and 5xx responses. HTTP 429 is not retried
+    # here; _get reports it to the rate limiter and retries it itself
+    MAX_RETRIES = 3
+    RETRY_BACKOFF = 0.5
+    RETRY_STATUSES = frozenset({500, 502, 503, 504})
+
+    # Retries for throttled requests (HTTP 429 or a THROTTLE_CODES response),
+    # after backing off the shared rate and sleeping THROTTLE_BACKOFF * 2**n
+    THROTTLE_RETRIES = 3
+    THROTTLE_BACKOFF = 1.0
+
+    def __init__(
+        self,
+        sessdata: str | None = None,
+        delay: float = 0.3,
+        max_connections: int = 10,
+        cache: CachedDataFetcher | None = None,
+        burst: int = RATE_BURST,
+    ) -> None:
         self.session = requests.Session()
         self.session.headers.update(self.BASE_HEADERS)
+        # Reuse keep-alive connections (and their TLS sessions) across all
+        # threads instead of discarding overflow connections
+        retry = Retry(
+            total=self.MAX_RETRIES,
+            backoff_factor=self.RETRY_BACKOFF,
+            status_forcelist=self.RETRY_STATUSES,
+            # Return the last response so _get's raise_for_status reports it
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_maxsize=max(1, max_connections), max_retries=retry)
+        self.session.mount('https://', adapter)
         self.delay = delay
+        self._bucket = (
+            _TokenBucket(rate=1.0 / delay, capacity=max(1, burst))
+            if delay > 0
+            else None
+        )
 
         if sessdata:
             cookie = Cookie(
@@ -167,9 +318,11 @@ class BilibiliClient:
 
         self._img_key: str | None = None
         self._sub_key: str | None = None
-
-        # Fetch buvid3 cookie by visiting the homepage (required for some APIs)
-        self.session.get('https://www.bilibili.com/')
+        self._mixin_key: str | None = None
+        self._cache = cache or CachedDataFetcher(cache=None)
+        self._buvid3_ready = False
+        self._wbi_reset = False
+        self._wbi_lock = threading.Lock()
 
     def __enter__(self) -> BilibiliClient:
         return self
@@ -182,19 +335,87 @@ class BilibiliClient:
         self.session.close()
 
     def _rate_limit(self) -> None:
-        """Apply rate limiting delay between requests."""
-        time.sleep(self.delay)
+        """
+        Apply rate limiting between requests.
+
+        Requests from all threads draw from one token bucket refilled at
+        ``1 / delay`` per second, allowing short bursts of ``burst`` requests.
+        """
+        if self._bucket is not None:
+            self._bucket.acquire()
+
+    def _record_throttling(self, throttled: bool) -> None:
+        """Slow the shared rate down on throttling, speed back up otherwise."""
+        if self._bucket is None:
+            return
+        if throttled:
+            self._bucket.backoff()
+            logger.info('Throttled; pacing at %.2f req/s', self._bucket.rate)
+        else:
+            self._bucket.recover()
 
     @staticmethod
     def _extract_key_from_url(url: str) -> str:
         """Extract the filename (without extension) from a URL path."""
         return url.rsplit('/', 1)[1].split('.')[0]
 
+    def _ensure_buvid3(self) -> None:
+        """
+        Make sure the session carries the buvid3 cookie.
+
+        WBI-signed endpoints expect it. The cookie is taken from the disk cache
+        (if any), or else obtained by visiting the homepage, once per client
+        and only if the session does not have it yet. Clients that never sign
+        a request skip the visit entirely.
+        """
+        if self._buvid3_ready:
+            return
+        with self._wbi_lock:
+            if self._buvid3_ready:
+                return
+            if 'buvid3' not in self.session.cookies:
+                buvid3 = self._cache.get(BUVID3_KEY)
+                if buvid3:
+                    self.session.cookies.set(
+                        'buvid3', buvid3, domain='.bilibili.com', path='/'
+                    )
+                else:
+                    self._rate_limit()
+                    self.session.get(
+                        'https://www.bilibili.com/', timeout=self.REQUEST_TIMEOUT
+                    )
+                    buvid3 = self.session.cookies.get('buvid3')
+                    if buvid3:
+                        self._cache.set(BUVID3_KEY, buvid3, TTL_BUVID3)
+            self._buvid3_ready = True
+
+    def _reset_wbi(self) -> None:
+        """
+        Forget the WBI keys and the buvid3 cookie, in memory and on disk.
+
+        Called when risk control rejects a signed request, so that the next
+        signed request starts over with fresh credentials instead of reusing
+        the cached ones until they expire. This happens at most once per
+        client: if fresh credentials are rejected too, fetching them again
+        would only add homepage and nav requests while risk control is on.
+        """
+        with self._wbi_lock:
+            if self._wbi_reset:
+                return
+            self._wbi_reset = True
+            self._img_key = self._sub_key = self._mixin_key = None
+            self._buvid3_ready = False
+            self.session.cookies.pop('buvid3', None)
+            self._cache.delete(WBI_KEYS_KEY)
+            self._cache.delete(BUVID3_KEY)
+
     def _get_wbi_keys(self) -> tuple[str, str]:
         """
-        Fetch WBI keys from nav API.
+        Get the WBI keys, fetching them from the nav API if needed.
 
-        Keys are cached after the first call.
+        Keys are cached in memory after the first call, and in the disk cache
+        (if any) for ``TTL_WBI_KEYS``. Concurrent callers wait for the first
+        fetch instead of racing to the nav API.
 
         Returns
         -------
@@ -206,10 +427,34 @@ class BilibiliClient:
         BilibiliAPIError
             If the API returns an error or keys are missing.
         """
-        if self._img_key and self._sub_key:
+        with self._wbi_lock:
+            if self._img_key and self._sub_key:
+                return self._img_key, self._sub_key
+
+            self._img_key, self._sub_key = self._cache.get_or_fetch(
+                WBI_KEYS_KEY, self._fetch_wbi_keys, TTL_WBI_KEYS
+            )
             return self._img_key, self._sub_key
 
-        resp = self.session.get('https://api.bilibili.com/x/web-interface/nav')
+    def _fetch_wbi_keys(self) -> tuple[str, str]:
+        """
+        Fetch WBI keys from nav API.
+
+        Returns
+        -------
+        tuple[str, str]
+            The (img_key, sub_key) pair used for WBI signing.
+
+        Raises
+        ------
+        BilibiliAPIError
+            If the API returns an error or keys are missing.
+        """
+        self._rate_limit()
+        resp = self.session.get(
+            'https://api.bilibili.com/x/web-interface/nav',
+            timeout=self.REQUEST_TIMEOUT,
+        )
         resp.raise_for_status()
         result = resp.json()
 
@@ -226,10 +471,34 @@ class BilibiliClient:
         if not img_url or not sub_url:
             raise BilibiliAPIError(-1, 'WBI keys not found in API response')
 
-        self._img_key = self._extract_key_from_url(img_url)
-        self._sub_key = self._extract_key_from_url(sub_url)
+        img_key = self._extract_key_from_url(img_url)
+        sub_key = self._extract_key_from_url(sub_url)
+        return img_key, sub_key
 
-        return self._img_key, self._sub_key
+    def _get_mixin_key(self) -> str:
+        """
+        Get the WBI mixin key.
+
+        The key is derived once from the cached WBI keys and reused for every
+        signed request.
+
+        Returns
+        -------
+        str
+            The 32-character key appended to the query before hashing.
+        """
+        # Read once: _reset_wbi may clear the attribute from another thread
+        mixin_key = self._mixin_key
+        if mixin_key is None:
+            img_key, sub_key = self._get_wbi_keys()
+            raw_key = img_key + sub_key
+            # Only the first 32 characters of the permutation are used
+            mixin_key = ''.join(raw_key[i] for i in MIXIN_KEY_ENC_TAB[:32])
+            with self._wbi_lock:
+                # Keys reset since they were read would make this key stale
+                if (self._img_key, self._sub_key) == (img_key, sub_key):
+                    self._mixin_key = mixin_key
+        return mixin_key
 
     def _sign_wbi(self, params: dict[str, Any]) -> dict[str, str]:
         """
@@ -245,19 +514,15 @@ class BilibiliClient:
         dict[str, str]
             Signed parameters including wts and w_rid fields.
         """
-        img_key, sub_key = self._get_wbi_keys()
-        mixin_key = reduce(
-            lambda s, i: s + (img_key + sub_key)[i], MIXIN_KEY_ENC_TAB, ''
-        )[:32]
-
-        signed: dict[str, str] = {str(k): str(v) for k, v in params.items()}
-        signed['wts'] = str(round(time.time()))
-        signed = dict(sorted(signed.items()))
+        self._ensure_buvid3()
+        mixin_key = self._get_mixin_key()
 
         # Filter out special characters from values
-        signed = {
-            k: ''.join(c for c in v if c not in "!'()*") for k, v in signed.items()
+        signed: dict[str, str] = {
+            str(k): str(v).translate(WBI_STRIP_TABLE) for k, v in params.items()
         }
+        signed['wts'] = str(round(time.time()))
+        signed = dict(sorted(signed.items()))
 
         query = urllib.parse.urlencode(signed)
         signed['w_rid'] = md5(
@@ -277,6 +542,9 @@ class BilibiliClient:
         """
         Make a GET request with optional WBI signing.
 
+        Throttled requests slow down the shared rate limiter and are retried
+        up to ``THROTTLE_RETRIES`` times before the error is reported.
+
         Parameters
         ----------
         url : str
@@ -297,25 +565,44 @@ class BilibiliClient:
         ------
         requests.HTTPError
             If the HTTP request fails.
+        requests.Timeout
+            If the server does not respond within ``REQUEST_TIMEOUT``.
         BilibiliAPIError
             If the API returns an error code (when check_code is True).
         """
-        self._rate_limit()
-
         if params is None:
             params = {}
 
-        if wbi:
-            params = self._sign_wbi(params)
+        for attempt in range(self.THROTTLE_RETRIES + 1):
+            self._rate_limit()
+            # Signed per attempt, since the signature covers a timestamp
+            query = self._sign_wbi(params) if wbi else params
+            resp = self.session.get(url, params=query, timeout=self.REQUEST_TIMEOUT)
+
+            code = None
+            throttled = resp.status_code == 429
+            if not throttled:
+                resp.raise_for_status()
+                result = json_loads(resp.content)
+                code = result.get('code')
+                throttled = code in THROTTLE_CODES
+            logger.debug('GET %s -> HTTP %d, code %s', url, resp.status_code, code)
+            self._record_throttling(throttled)
+            if not throttled or attempt == self.THROTTLE_RETRIES:
+                break
+
+            wait = self.THROTTLE_BACKOFF * 2**attempt
+            logger.info('Throttled on %s; retrying in %.1fs', url, wait)
+            time.sleep(wait)
 
-        resp = self.session.get(url, params=params)
+        # Still throttled by HTTP status after the last retry
         resp.raise_for_status()
-        result = resp.json()
 
-        if check_code:
-            code = result.get('code')
-            if code is not None and code != 0:
-                raise BilibiliAPIError(code, result.get('message', 'Unknown error'))
+        if wbi and code == RISK_CONTROL_CODE:
+            self._reset_wbi()
+
+        if check_code and code is not None and code != 0:
+            raise BilibiliAPIError(code, result.get('message', 'Unknown error'))
 
         return result
 
@@ -323,7 +610,7 @@ class BilibiliClient:
         self,
         oid: int | str,
         type_: int,
-        page_size: int = 20,
+        page_size: int = 30,
         max_count: int | None = None,
     ) -> Iterator[dict[str, Any]]:
         """
@@ -336,18 +623,26 @@ class BilibiliClient:
         type_ : int
             The comment type (1 for videos, 17 for dynamics).
         page_size : int, optional
-            Number of results per page. Default is 20.
+            Number of results per page, at most 30. Default is 30.
         max_count : int or None, optional
             Maximum number of comments to return. None for unlimited.
 
-        Yields
-        ------
-        dict[str, Any]
+        Returns
+        -------
+        Iterator[dict[str, Any]]
             Comment info including member.mid, content, ctime, etc.
         """
+        # Pages are numbered, so the size must stay fixed across requests
+        if max_count:
+            page_size = min(page_size, max_count)
+        return islice(self._iter_comments(oid, type_, page_size), max_count or None)
+
+    def _iter_comments(
+        self, oid: int | str, type_: int, page_size: int
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over all comments for an object, one page at a time."""
         url = 'https://api.bilibili.com/x/v2/reply/wbi/main'
         next_offset = None
-        count = 0
 
         while True:
             params: dict[str, Any] = {
@@ -359,15 +654,9 @@ class BilibiliClient:
             if next_offset:
                 params['next'] = next_offset
 
-            data = self._get(url, params, wbi=True)
-            cursor = data.get('data', {}).get('cursor', {})
-            replies: list[dict[str, Any]] = data.get('data', {}).get('replies') or []
-
-            for reply in replies:
-                yield reply
-                count += 1
-                if max_count and count >= max_count:
-                    return
+            page = self._get(url, params, wbi=True).get('data') or {}
+            cursor = page.get('cursor') or {}
+            yield from page.get('replies') or []
 
             if not cursor.get('is_end', True):
                 next_offset = cursor.get('next')
@@ -401,8 +690,9 @@ class BilibiliClient:
         pn = 1
 
         while True:
-            data = self._get(url, {'vmid': mid, 'ps': page_size, 'pn': pn})
-            following_list = data.get('data', {}).get('list', [])
+            params = {'vmid': mid, 'ps': page_size, 'pn': pn}
+            page = self._get(url, params).get('data') or {}
+            following_list = page.get('list') or []
 
             if not following_list:
                 break
@@ -451,33 +741,41 @@ class BilibiliClient:
         max_count : int or None, optional
             Maximum number of videos to return. None for unlimited.
 
-        Yields
-        ------
-        dict[str, Any]
+        Returns
+        -------
+        Iterator[dict[str, Any]]
             Video info including aid, title, created, etc.
         """
+        # Pages are numbered, so the size must stay fixed across requests
+        if max_count:
+            page_size = min(page_size, max_count)
+        return islice(self._iter_user_videos(mid, page_size), max_count or None)
+
+    def _iter_user_videos(self, mid: int, page_size: int) -> Iterator[dict[str, Any]]:
+        """Iterate over all of a user's videos, one page at a time."""
         url = 'https://api.bilibili.com/x/space/wbi/arc/search'
         pn = 1
-        count = 0
+        seen = 0
 
         while True:
             params = {'mid': mid, 'ps': page_size, 'pn': pn, 'order': 'pubdate'}
-            data = self._get(url, params, wbi=True)
+            page = self._get(url, params, wbi=True).get('data') or {}
 
-            vlist = data.get('data', {}).get('list', {}).get('vlist', [])
+            vlist = (page.get('list') or {}).get('vlist') or []
             if not vlist:
                 break
 
-            for video in vlist:
-                yield video
-                count += 1
-                if max_count and count >= max_count:
-                    return
-
+            yield from vlist
+            # Stop at the reported total rather than on a short page, since the
+            # server caps oversized pages; this skips requesting an empty page
+            seen += len(vlist)
+            count = (page.get('page') or {}).get('count')
+            if count is not None and seen >= count:
+                break
             pn += 1
 
     def get_video_comments(
-        self, aid: int, page_size: int = 20, max_count: int | None = None
+        self, aid: int, page_size: int = 30, max_count: int | None = None
     ) -> Iterator[dict[str, Any]]:
         """
         Iterate over comments on a video.
@@ -487,7 +785,7 @@ class BilibiliClient:
         aid : int
             The video's archive ID (aid).
         page_size : int, optional
-            Number of results per page. Default is 20.
+            Number of results per page, at most 30. Default is 30.
         max_count : int or None, optional
             Maximum number of comments to return. None for unlimited.
 
@@ -517,28 +815,31 @@ class BilibiliClient:
 
         Common pattern for dynamic-related APIs that use offset + has_more pagination.
         """
+        return islice(
+            self._iter_offset_items(url, base_params, wbi=wbi), max_count or None
+        )
+
+    def _iter_offset_items(
+        self, url: str, base_params: dict[str, Any], *, wbi: bool
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over all offset-paginated items, one page at a time."""
         offset = None
-        count = 0
 
         while True:
             params = dict(base_params)
             if offset:
                 params['offset'] = offset
 
-            data = self._get(url, params, wbi=wbi)
-            items: list[dict[str, Any]] = data.get('data', {}).get('items') or []
+            page = self._get(url, params, wbi=wbi).get('data') or {}
+            items: list[dict[str, Any]] = page.get('items') or []
 
             if not items:
                 break
 
-            for item in items:
-                yield item
-                count += 1
-                if max_count and count >= max_count:
-                    return
+            yield from items
 
-            if data.get('data', {}).get('has_more'):
-                offset = data['data'].get('offset')
+            if page.get('has_more'):
+                offset = page.get('offset')
             else:
                 break
 
@@ -589,7 +890,7 @@ class BilibiliClient:
         yield from self._iterate_offset_paginated(url, {'id': dynamic_id}, max_count)
 
     def get_dynamic_comments(
-        self, dynamic_id: str, page_size: int = 20, max_count: int | None = None
+        self, dynamic_id: str, page_size: int = 30, max_count: int | None = None
     ) -> Iterator[dict[str, Any]]:
         """
         Get comments on a dynamic.
@@ -599,7 +900,7 @@ class BilibiliClient:
         dynamic_id : str
             The dynamic's ID string.
         page_size : int, optional
-            Number of results per page. Default is 20.
+            Number of results per page, at most 30. Default is 30.
         max_count : int or None, optional
             Maximum number of comments to return. None for unlimited.
 
@@ -612,7 +913,12 @@ class BilibiliClient:
             dynamic_id, type_=17, page_size=page_size, max_count=max_count
         )
 
-    def get_user_activity(self, mid: int, max_dynamics: int = 10) -> UserActivity:
+    def get_user_activity(
+        self,
+        mid: int,
+        max_dynamics: int = 10,
+        following_count: int | None = None,
+    ) -> UserActivity:
         """
         Get user activity info for filtering purposes.
 
@@ -628,13 +934,17 @@ class BilibiliClient:
             The user's member ID.
         max_dynamics : int, optional
             Maximum number of dynamics to fetch for analysis. Default is 10.
+        following_count : int or None, optional
+            The user's following count, if already known from a
+            :meth:`get_user_stat` result. Fetched when None.
 
         Returns
         -------
         UserActivity
             Activity info tagged with an :class:`ActivityStatus`.
         """
-        following_count = self.get_user_stat(mid).get('following', 0)
+        if following_count is None:
+            following_count = self.get_user_stat(mid).get('following', 0)
 
         try:
             dynamics = list(self.get_user_dynamics(mid, max_count=max_dynamics))
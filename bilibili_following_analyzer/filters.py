@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-import re
+import functools
+import operator
 import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, ClassVar, Self
 
@@ -16,13 +18,16 @@ from .cache import (
     make_user_stat_key,
 )
 from .client import ActivityStatus, UserActivity
+from .utils import progress
 
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
     from .client import BilibiliClient
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchInfo:
     """
     Result of a filter match operation.
@@ -75,6 +80,9 @@ class FilterContext:
         In-memory cache for user stats (hot cache for current session).
     user_activity : dict[int, UserActivity]
         In-memory cache for user activity (hot cache for current session).
+    now_ts : int
+        Reference Unix timestamp for age comparisons, taken once at creation
+        so every user is judged against the same moment.
     """
 
     client: BilibiliClient
@@ -83,6 +91,7 @@ class FilterContext:
     cache: CachedDataFetcher = field(default_factory=CachedDataFetcher)
     user_stats: dict[int, dict[str, Any]] = field(default_factory=dict)
     user_activity: dict[int, UserActivity] = field(default_factory=dict)
+    now_ts: int = field(default_factory=lambda: int(time.time()))
 
     def get_user_stat(self, mid: int) -> dict[str, Any]:
         """
@@ -107,6 +116,8 @@ class FilterContext:
         Get user activity with two-level caching.
 
         First checks in-memory cache, then disk cache, then fetches from API.
+        The following count embedded in the activity comes from
+        :meth:`get_user_stat`, so a user's stat is requested at most once.
         """
         if mid in self.user_activity:
             return self.user_activity[mid]
@@ -114,18 +125,94 @@ class FilterContext:
         key = make_user_activity_key(mid)
         activity = self.cache.get_or_fetch(
             key,
-            lambda: self.client.get_user_activity(mid, max_dynamics=max_dynamics),
+            lambda: self.client.get_user_activity(
+                mid,
+                max_dynamics=max_dynamics,
+                following_count=self.get_user_stat(mid).get('following', 0),
+            ),
             TTL_USER_ACTIVITY,
         )
         self.user_activity[mid] = activity
         return activity
 
+    def prefetch_user_stats(self, mids: Iterable[int], max_workers: int = 5) -> None:
+        """
+        Fetch user stats for many users concurrently.
 
-@dataclass
+        Warms the same two-level cache used by :meth:`get_user_stat`, so
+        filters evaluated afterwards are served from memory. Entries already
+        on disk are loaded directly; only the misses hit the API.
+
+        Parameters
+        ----------
+        mids : Iterable[int]
+            Member IDs to fetch stats for.
+        max_workers : int, optional
+            Number of concurrent fetches. Default is 5.
+        """
+        missing = self._load_cached(mids, self.user_stats, make_user_stat_key)
+        self._prefetch(self.get_user_stat, missing, max_workers, 'Stats')
+
+    def prefetch_user_activity(self, mids: Iterable[int], max_workers: int = 5) -> None:
+        """
+        Fetch user activity for many users concurrently.
+
+        Counterpart of :meth:`prefetch_user_stats` for :meth:`get_user_activity`.
+
+        Parameters
+        ----------
+        mids : Iterable[int]
+            Member IDs to fetch activity for.
+        max_workers : int, optional
+            Number of concurrent fetches. Default is 5.
+        """
+        missing = self._load_cached(mids, self.user_activity, make_user_activity_key)
+        self._prefetch(self.get_user_activity, missing, max_workers, 'Activity')
+
+    def _load_cached(
+        self,
+        mids: Iterable[int],
+        loaded: dict[int, Any],
+        make_key: Callable[[int], str],
+    ) -> list[int]:
+        """Move disk-cached entries into ``loaded`` and return the misses."""
+        missing: list[int] = []
+        for mid in dict.fromkeys(mids):
+            if mid in loaded:
+                continue
+            value = self.cache.get(make_key(mid))
+            if value is None:
+                missing.append(mid)
+            else:
+                loaded[mid] = value
+        return missing
+
+    @staticmethod
+    def _prefetch(
+        fetch: Callable[[int], Any],
+        mids: list[int],
+        max_workers: int,
+        desc: str,
+    ) -> None:
+        """Run ``fetch`` for every mid on a thread pool."""
+        if not mids:
+            return
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            for _ in progress(
+                executor.map(fetch, mids), total=len(mids), desc=desc, unit='user'
+            ):
+                pass
+
+
+@dataclass(slots=True, frozen=True)
 class Following:
     """
     A following user with their relationship data.
 
+    Instances are slotted and immutable: one is created per following, and
+    they are read concurrently by the prefetch workers.
+
     Attributes
     ----------
     mid : int
@@ -151,7 +238,7 @@ class Following:
         return f'https://space.bilibili.com/{self.mid}'
 
 
-@dataclass
+@dataclass(slots=True)
 class FilterResult:
     """
     Result of applying filters to a user.
@@ -177,6 +264,11 @@ class FilterResult:
             self.details[filter_name] = detail
 
 
+# Per-user data fetched from the API, cheapest first: a stat is one small
+# response, while activity is a page of dynamics
+FETCHED_DATA = ('stat', 'activity')
+
+
 class Filter(ABC):
     """
     Abstract base class for all filters.
@@ -196,6 +288,23 @@ class Filter(ABC):
     # Parameter description for help text (if has_param is True)
     param_help: ClassVar[str] = ''
 
+    # Data the filter reads from the context: per-user 'stat' / 'activity', or
+    # the 'interactions' collected before filtering. Composite filters set it
+    # per instance to the union of their children's.
+    requires: frozenset[str] = frozenset()
+
+    @property
+    def cost(self) -> int:
+        """Rank of the costliest fetched data the filter reads (0 for none)."""
+        return max(
+            (
+                rank
+                for rank, kind in enumerate(FETCHED_DATA, 1)
+                if kind in self.requires
+            ),
+            default=0,
+        )
+
     @classmethod
     def _require_param(cls, param: str | None) -> str:
         """Validate that a parameter is provided."""
@@ -203,24 +312,6 @@ class Filter(ABC):
             raise ValueError(f'Filter {cls.name!r} requires a parameter')
         return param
 
-    @classmethod
-    def _parse_int_param(cls, param: str | None) -> int:
-        """Parse and validate an integer parameter."""
-        param = cls._require_param(param)
-        try:
-            return int(param)
-        except ValueError:
-            raise ValueError(f'Filter {cls.name!r} requires an integer') from None
-
-    @classmethod
-    def _parse_float_param(cls, param: str | None) -> float:
-        """Parse and validate a float parameter."""
-        param = cls._require_param(param)
-        try:
-            return float(param)
-        except ValueError:
-            raise ValueError(f'Filter {cls.name!r} requires a number') from None
-
     @classmethod
     def create(cls, param: str | None = None) -> Filter:
         """
@@ -298,14 +389,41 @@ class MutualFollowFilter(Filter):
         return MatchInfo.no_match()
 
 
-class _ThresholdStatFilter(Filter):
+class _NumericParamFilter(Filter):
+    """
+    Base class for filters that take a single numeric parameter.
+
+    Subclasses set ``param_type`` and accept the parsed value as the only
+    argument of ``__init__``.
+    """
+
+    has_param = True
+
+    # Type the parameter string is parsed as: int or float
+    param_type: ClassVar[type[int] | type[float]] = int
+
+    @abstractmethod
+    def __init__(self, value: Any) -> None: ...
+
+    @classmethod
+    def create(cls, param: str | None = None) -> Filter:
+        param = cls._require_param(param)
+        try:
+            value = cls.param_type(param)
+        except ValueError:
+            kind = 'an integer' if cls.param_type is int else 'a number'
+            raise ValueError(f'Filter {cls.name!r} requires {kind}') from None
+        return cls(value)
+
+
+class _ThresholdStatFilter(_NumericParamFilter):
     """
     Base class for filters that compare a user stat against a threshold.
 
     Subclasses must define class attributes for configuration.
     """
 
-    has_param = True
+    requires = frozenset({'stat'})
 
     # Subclass configuration (to be overridden)
     stat_field: ClassVar[str]  # 'follower' or 'following'
@@ -314,19 +432,15 @@ class _ThresholdStatFilter(Filter):
 
     def __init__(self, threshold: int) -> None:
         self.threshold = threshold
-
-    @classmethod
-    def create(cls, param: str | None = None) -> Filter:
-        return cls(cls._parse_int_param(param))
+        # Resolve the comparison once instead of branching on every user
+        self._compare: Callable[[int, int], bool] = (
+            operator.gt if self.compare_above else operator.lt
+        )
 
     def matches(self, following: Following, ctx: FilterContext) -> MatchInfo:
         stat = ctx.get_user_stat(following.mid)
         value = stat.get(self.stat_field, 0)
-        if self.compare_above:
-            matched = value > self.threshold
-        else:
-            matched = value < self.threshold
-        if matched:
+        if self._compare(value, self.threshold):
             return MatchInfo.match(self.name, f'{self.detail_prefix} {value}')
         return MatchInfo.no_match()
 
@@ -358,6 +472,7 @@ class NoInteractionFilter(Filter):
 
     name = 'no-interaction'
     description = 'Users who have not interacted with your recent content'
+    requires = frozenset({'interactions'})
 
     def matches(self, following: Following, ctx: FilterContext) -> MatchInfo:
         if following.mid not in ctx.interacting_users:
@@ -376,20 +491,19 @@ class TooManyFollowingsFilter(_ThresholdStatFilter):
     detail_prefix = '关注数'
 
 
-class InactiveFilter(Filter):
+class InactiveFilter(_NumericParamFilter):
     """Filter users who haven't posted in N days."""
 
     name = 'inactive'
     description = 'Users who have not posted in N days'
-    has_param = True
     param_help = 'DAYS (inactivity threshold)'
+    requires = frozenset({'activity'})
 
     def __init__(self, days: int) -> None:
         self.days = days
-
-    @classmethod
-    def create(cls, param: str | None = None) -> Filter:
-        return cls(cls._parse_int_param(param))
+        # A post is too old once it is at least (days + 1) whole days old,
+        # i.e. its age floored to days exceeds the threshold
+        self._min_age = (days + 1) * 86400
 
     def matches(self, following: Following, ctx: FilterContext) -> MatchInfo:
         activity = ctx.get_user_activity(following.mid)
@@ -406,29 +520,26 @@ class InactiveFilter(Filter):
             return MatchInfo.match(self.name, '无任何动态')
 
         if activity.last_post_ts is not None:
-            now_ts = int(time.time())
-            days_since_post = (now_ts - activity.last_post_ts) // 86400
-            if days_since_post > self.days:
+            age = ctx.now_ts - activity.last_post_ts
+            if age >= self._min_age:
+                days_since_post = age // 86400
                 return MatchInfo.match(self.name, f'超过 {days_since_post} 天未更新')
 
         return MatchInfo.no_match()
 
 
-class RepostRatioFilter(Filter):
+class RepostRatioFilter(_NumericParamFilter):
     """Filter users whose recent posts are mostly reposts."""
 
     name = 'repost-ratio'
     description = 'Users whose repost ratio exceeds RATIO (0.0-1.0)'
-    has_param = True
     param_help = 'RATIO (e.g., 0.8 for 80%)'
+    param_type = float
+    requires = frozenset({'activity'})
 
     def __init__(self, ratio: float) -> None:
         self.ratio = ratio
 
-    @classmethod
-    def create(cls, param: str | None = None) -> Filter:
-        return cls(cls._parse_float_param(param))
-
     def matches(self, following: Following, ctx: FilterContext) -> MatchInfo:
         activity = ctx.get_user_activity(following.mid)
 
@@ -448,6 +559,7 @@ class DeactivatedFilter(Filter):
 
     name = 'deactivated'
     description = 'Users with deactivated or inaccessible accounts'
+    requires = frozenset({'activity'})
 
     def matches(self, following: Following, ctx: FilterContext) -> MatchInfo:
         activity = ctx.get_user_activity(following.mid)
@@ -461,6 +573,7 @@ class NoPostsFilter(Filter):
 
     name = 'no-posts'
     description = 'Users who have no posts/dynamics at all'
+    requires = frozenset({'activity'})
 
     def matches(self, following: Following, ctx: FilterContext) -> MatchInfo:
         activity = ctx.get_user_activity(following.mid)
@@ -486,15 +599,23 @@ class AndFilter(Filter):
 
     def __init__(self, filters: list[Filter]) -> None:
         self.filters = filters
+        self.requires = frozenset().union(*(f.requires for f in filters))
+        # Cheapest children run first, so a user they reject is never fetched
+        # for the others. This is the order prefetching narrows users in.
+        self._by_cost = sorted(enumerate(filters), key=lambda item: item[1].cost)
 
     def matches(self, following: Following, ctx: FilterContext) -> MatchInfo:
-        all_details: list[str] = []
-        all_filter_names: list[str] = []
-
-        for f in self.filters:
+        hits: list[tuple[int, MatchInfo]] = []
+        for index, f in self._by_cost:
             result = f.matches(following, ctx)
             if not result.matched:
                 return MatchInfo.no_match()
+            hits.append((index, result))
+
+        # Report matches in the order the children were written
+        all_details: list[str] = []
+        all_filter_names: list[str] = []
+        for _, result in sorted(hits, key=lambda hit: hit[0]):
             if result.detail:
                 all_details.append(result.detail)
             all_filter_names.extend(result.filter_names)
@@ -518,6 +639,7 @@ class OrFilter(Filter):
 
     def __init__(self, filters: list[Filter]) -> None:
         self.filters = filters
+        self.requires = frozenset().union(*(f.requires for f in filters))
 
     def matches(self, following: Following, ctx: FilterContext) -> MatchInfo:
         all_details: list[str] = []
@@ -561,6 +683,10 @@ ALL_FILTERS: list[type[Filter]] = [
 FILTER_REGISTRY: dict[str, type[Filter]] = {f.name: f for f in ALL_FILTERS}
 
 
+# Characters allowed in a filter name
+_FILTER_NAME_CHARS = '-abcdefghijklmnopqrstuvwxyz'
+
+
 def parse_filter_spec(spec: str) -> Filter:
     """
     Parse a filter specification string into a Filter instance.
@@ -580,23 +706,22 @@ def parse_filter_spec(spec: str) -> Filter:
     ValueError
         If the filter name is unknown or parameter is invalid.
     """
-    # Parse name and optional parameter
-    match = re.match(r'^([a-z-]+)(?::(.+))?$', spec)
-    if not match:
+    # Parse name and optional parameter: 'name' or 'name:param'
+    name, sep, param = spec.partition(':')
+    if not name or name.strip(_FILTER_NAME_CHARS) or (sep and not param):
         raise ValueError(f'Invalid filter spec: {spec!r}')
 
-    name, param = match.groups()
-
     if name not in FILTER_REGISTRY:
         available = ', '.join(sorted(FILTER_REGISTRY.keys()))
         raise ValueError(f'Unknown filter: {name!r}. Available: {available}')
 
     filter_cls = FILTER_REGISTRY[name]
-    return filter_cls.create(param)
+    return filter_cls.create(param or None)
 
 
+@functools.cache
 def get_filter_help() -> str:
-    """Generate help text for all available filters."""
+    """Generate help text for all available filters (built once)."""
     lines = ['Available filters:']
     for f in ALL_FILTERS:
         if f.has_param:
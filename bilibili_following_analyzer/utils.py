@@ -4,14 +4,76 @@ from __future__ import annotations
 
 import csv
 import json
+import sys
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TypeVar
+
+
+try:  # Optional faster JSON encoder (pip install bilibili-following-analyzer[fast])
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from .filters import FilterResult
 
 
+T = TypeVar('T')
+
+
+def _dump_json(data: object) -> bytes:
+    """Serialize data as indented UTF-8 JSON, using orjson if installed."""
+    if orjson is None:
+        return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+
+def progress(
+    iterable: Iterable[T],
+    *,
+    desc: str,
+    unit: str,
+    total: int | None = None,
+    quiet: bool = False,
+) -> Iterable[T]:
+    """
+    Wrap an iterable in a tqdm progress bar.
+
+    The bar is only drawn when stderr is a terminal, so redirected output
+    and logs stay free of progress updates.
+
+    Parameters
+    ----------
+    iterable : Iterable[T]
+        The items to iterate over.
+    desc : str
+        Label shown before the bar.
+    unit : str
+        Name of one item.
+    total : int or None, optional
+        Number of items, for iterables without a length.
+    quiet : bool, optional
+        Hide the bar regardless of the terminal. Default is False.
+
+    Returns
+    -------
+    Iterable[T]
+        The items of ``iterable``, in order.
+    """
+    from tqdm import tqdm
+
+    return tqdm(
+        iterable,
+        total=total,
+        desc=desc,
+        unit=unit,
+        disable=quiet or not sys.stderr.isatty(),
+    )
+
+
 def load_allow_list(path: Path | None) -> set[int]:
     """
     Load allow list from a file.
@@ -126,7 +188,7 @@ def output_results_to_file(results: list[FilterResult], path: Path) -> None:
 
     if suffix == '.json':
         data = [_result_to_dict(r) for r in results]
-        path.write_text(json.dumps(data, ensure_ascii=False, indent=2))
+        path.write_bytes(_dump_json(data))
     elif suffix == '.csv':
         with path.open('w', newline='', encoding='utf-8') as f:
             writer = csv.writer(f)